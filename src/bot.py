@@ -7,13 +7,13 @@ import aiohttp
 import asyncio
 import dataclasses
 import datetime
-import json
 import logging
 import pathlib
 import os
 import sys
+import time
 
-from bs4 import BeautifulSoup
+import orjson
 from discord import (
 	app_commands,
 	Client,
@@ -27,6 +27,7 @@ from discord import (
 	TextChannel,
 	VoiceChannel,
 )
+from selectolax.lexbor import LexborHTMLParser
 
 from . import scanner
 
@@ -34,61 +35,143 @@ from . import scanner
 logger = logging.getLogger('bot')
 
 NY_TZ = ZoneInfo('America/New_York')
+EVENT_TIME = datetime.time(22)		# Club meetings start at 10:00 PM Eastern
+REMINDER_TIME = datetime.time(10)	# Daily announcements are made at 10:00 AM Eastern
+POLL_DURATION = datetime.timedelta(hours=24)	# How long a ballot stays open for votes
+
+# Announcements are always in English, so the names are fixed here instead of going through the C locale via strftime().
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+MONTH_NAMES = (
+	'January', 'February', 'March', 'April', 'May', 'June',
+	'July', 'August', 'September', 'October', 'November', 'December',
+)
+
+def format_day(dt: datetime.datetime) -> str:
+	"""Formats the date of `dt` in Eastern time like strftime('%A, %B %e')."""
+
+	dt = dt.astimezone(NY_TZ)
+	return f'{WEEKDAY_NAMES[dt.weekday()]}, {MONTH_NAMES[dt.month - 1]} {dt.day:>2}'
+
+def dump_atomic(obj, path: pathlib.Path):
+	"""
+	Serializes `obj` as JSON to `path`.
+
+	The data is written to a temporary file which then replaces `path`, so a crash mid-write leaves the previous
+	contents intact instead of a truncated file. The temporary file is synced to disk before the swap so that a power
+	loss can't leave `path` pointing at data that was never written.
+	"""
+
+	tmp_path = path.with_name(path.name + '.tmp')
+	with open(tmp_path, 'wb') as tmp_file:
+		tmp_file.write(orjson.dumps(obj))
+		tmp_file.flush()
+		os.fsync(tmp_file.fileno())
+	os.replace(tmp_path, path)
 
 class MovieInfo:
 
-	def __init__(self, title: str, year: str|None, url: str, img: bytes|None = None):
+	# Seconds a scraped page is reused before Letterboxd is queried again. This outlasts a ballot's poll, with a day to
+	# spare, so that 'End Voting' finds the winner that /ballot already scraped.
+	CACHE_TTL = (POLL_DURATION + datetime.timedelta(days=1)).total_seconds()
+	CACHE_SIZE = 128
+	_cache: dict[str, tuple[float, 'MovieInfo']] = {}
+	_pending: dict[str, asyncio.Task] = {}
+
+	def __init__(self, title: str, year: str|None, url: str, img: bytes|None = None, backdrop_url: str|None = None):
 
 		self.title = title
 		self.year  = year
 		self.url   = url
 		self.img   = img
+		self.backdrop_url = backdrop_url
+		self.display = f'{title} ({year})' if year else title
 
 	def __str__(self) -> str:
-		if not self.year:
-			return self.title
+		return self.display
+
+	@classmethod
+	async def from_url(cls, session: aiohttp.ClientSession, url: str, fetch_image: bool = False):
+		"""
+		Retrieves the film information from a Letterboxd page, reusing recently scraped results.
+
+		If a cached result is missing the backdrop image and `fetch_image` is set, only the image is
+		downloaded.
+		"""
+
+		cached = cls._cache.get(url)
+		if cached and time.monotonic() - cached[0] < cls.CACHE_TTL:
+			logger.debug('Using cached Letterboxd page for %s', url)
+			info = cached[1]
 		else:
-			return f'{self.title} ({self.year})'
+			# Concurrent requests for the same page share one scrape instead of each missing the cache and fetching it.
+			task = cls._pending.get(url)
+			if not task:
+				task = asyncio.create_task(cls.scrape(session, url))
+				cls._pending[url] = task
+				task.add_done_callback(lambda _: cls._pending.pop(url, None))
+			# Shielded so that one caller being cancelled doesn't abort the scrape for everyone else waiting on it.
+			info = await asyncio.shield(task)
+			cls.cache(info)
+
+		if fetch_image and info.img is None:
+			if not info.backdrop_url:
+				logger.debug('Letterboxd page missing backdrop')
+			else:
+				try:
+					async with session.get(info.backdrop_url) as resp:
+						img = await resp.read()
+				except Exception:
+					logger.debug('Failed to retrieve backdrop image', exc_info=sys.exc_info())
+				else:
+					info = cls(info.title, info.year, info.url, img, info.backdrop_url)
+					cls.cache(info)
+		return info
 
 	@classmethod
-	async def from_url(cls, url: str, fetch_image: bool = False):
+	async def scrape(cls, session: aiohttp.ClientSession, url: str):
 		try:
-			async with aiohttp.request('get', url) as resp:
-				html = await resp.text()
+			async with session.get(url) as resp:
+				html = await resp.read()
+				encoding = resp.get_encoding()
 		except Exception:
 			logger.exception('Failed to retrieve webpage', exc_info=sys.exc_info())
 			raise
+		# Lexbor treats bytes as UTF-8 whatever charset the page declares, so any other encoding is decoded here first.
+		page: bytes | str = html if encoding == 'utf-8' else html.decode(encoding, errors='replace')
+
+		# Parsing is pure CPU work, so it runs in a worker thread to keep the event loop free for gateway traffic. Log
+		# records from that thread have no task name, so parse() names the URL in its messages instead.
+		info = await asyncio.to_thread(cls.parse, url, page)
+		logger.info('Finished scraping Letterboxd page %s', url)
+		return info
 
-		# Scrape HTML to find film title, release year, and backdrop image (if it exists)
-		doc = BeautifulSoup(html, 'html.parser')
+	@classmethod
+	def parse(cls, url: str, html: bytes | str):
+		# Scrape HTML to find film title, release year, and backdrop image (if it exists). UTF-8 pages are passed as
+		# the raw bytes, which skips decoding them into a str that Lexbor would only encode back to UTF-8.
+		doc = LexborHTMLParser(html)		# type: ignore # selectolax accepts UTF-8 bytes at runtime; its stub only lists str.
 		try:
-			title = doc.find(class_='js-widont').string
+			title = doc.css_first('.js-widont').text().strip()
 		except Exception:
-			logger.exception('Failed to read film title', exc_info=sys.exc_info())
+			logger.exception('Failed to read film title from %s', url, exc_info=sys.exc_info())
 			raise
 		try:
-			year = doc.find(class_="releasedate").string
+			year = doc.css_first('.releasedate').text().strip()
 		except Exception:
-			logger.warning('Failed to read release year', exc_info=sys.exc_info())
+			logger.warning('Failed to read release year from %s', url, exc_info=sys.exc_info())
 			year = None
-		if fetch_image:
-			backdrop = doc.find(id='backdrop')
-			if not backdrop:
-				logger.debug('Letterboxd page missing backdrop')
-				img = None
-			else:
-				try:
-					async with aiohttp.request('get', backdrop['data-backdrop']) as resp:
-						img = await resp.read()
-				except Exception:
-					logger.debug('Failed to retrieve backdrop image', exc_info=sys.exc_info())
-					img = None
-		else:
-			img = None
-		logger.info('Finished scraping Letterboxd page')
-		return cls(title, year, url, img)
+		backdrop = doc.css_first('#backdrop')
+		backdrop_url = backdrop.attributes.get('data-backdrop') if backdrop else None
+		return cls(title, year, url, backdrop_url=backdrop_url)
 
-@dataclasses.dataclass
+	@classmethod
+	def cache(cls, info: 'MovieInfo'):
+		cls._cache.pop(info.url, None)
+		if len(cls._cache) >= cls.CACHE_SIZE:
+			del cls._cache[next(iter(cls._cache))]
+		cls._cache[info.url] = (time.monotonic(), info)
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class Session:
 
 	id: int
@@ -105,7 +188,7 @@ class Session:
 	def replace(self, **changes):
 		return dataclasses.replace(self, **changes)
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ClubMember:
 
 	id: int
@@ -145,23 +228,33 @@ class Timer:
 		self.callback = callback
 		self.repeat = repeat
 		self.delay = -1
+		self.task: asyncio.Task | None = None
 
 	async def start(self):
 
-		ten_am_tomorrow = datetime.datetime.combine(datetime.date.today() + datetime.timedelta(days=1), datetime.time(10), tzinfo = NY_TZ)
-		self.delay = (ten_am_tomorrow - datetime.datetime.now(NY_TZ)).total_seconds()
-		asyncio.create_task(self.execute())
+		self.delay = self.time_until_next()
+		self.task = asyncio.create_task(self.execute())
 		logger.info('Timer started.')
 
+	def time_until_next(self) -> float:
+		now = datetime.datetime.now(NY_TZ)
+		ten_am_tomorrow = now.replace(hour=REMINDER_TIME.hour, minute=REMINDER_TIME.minute, second=0, microsecond=0) + datetime.timedelta(days=1)
+		# Subtracting two datetimes that share a tzinfo ignores their UTC offsets, so compare timestamps instead to
+		# stay correct across DST changes.
+		return ten_am_tomorrow.timestamp() - now.timestamp()
+
 	async def execute(self):
-		logger.info(f'Waiting for {self.delay} seconds')
-		await asyncio.sleep(self.delay)
-		logger.info('Finished waiting')
-		if self.wait:
-			await self.wait()
-		await self.callback()
-		if self.repeat:
-			asyncio.create_task(self.execute())
+		# A single long-lived task loops for the life of the timer rather than spawning a new task for every run.
+		while True:
+			logger.info(f'Waiting for {self.delay} seconds')
+			await asyncio.sleep(self.delay)
+			logger.info('Finished waiting')
+			if self.wait:
+				await self.wait()
+			await self.callback()
+			if not self.repeat:
+				return
+			self.delay = self.time_until_next()
 
 @dataclasses.dataclass
 class Domain:
@@ -177,46 +270,35 @@ class Domain:
 	event_channel: VoiceChannel
 	member_role: Role
 	data_dir: pathlib.Path
+	http_session: aiohttp.ClientSession
+	events_path: pathlib.Path = dataclasses.field(init=False)
+	members_path: pathlib.Path = dataclasses.field(init=False)
+	sessions_lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock, init=False, repr=False)
+	sessions_cache: tuple[tuple[int,int,int], list[Session]] | None = dataclasses.field(default=None, init=False, repr=False)
 
 	def __post_init__(self):
 		self.data_dir = self.data_dir / self.name
 		os.makedirs(self.data_dir, mode=0o755, exist_ok=True)
-		try:
-			events_file = open(self.events_path, 'x')
-		except FileExistsError:
-			pass
-		else:
-			json.dump([], events_file)
-			events_file.close()
-
-		try:
-			members_file = open(self.members_path, 'x')
-		except FileExistsError:
-			pass
-		else:
-			json.dump([], members_file)
-			members_file.close()
-
-	@property
-	def events_path(self):
-		return self.data_dir / 'events.json'
-
-	@property
-	def members_path(self):
-		return self.data_dir / 'members.json'
+		self.events_path = self.data_dir / 'events.json'
+		self.members_path = self.data_dir / 'members.json'
+		for path in (self.events_path, self.members_path):
+			if not path.exists():
+				dump_atomic([], path)
 
 	async def handle_command(self, message: Message):
 		"""Processes a command in the control channel"""
 
 		if message.channel != self.control_channel:
 			return
-		logger.debug(f'Control message: «{message.content}»')
-		content = message.content.strip().partition(' ')[2].strip()
+		logger.debug('Control message: «%s»', message.content)
+		# A valid command is exactly the bot mention followed by the URL.
+		words = message.content.split()
+		content = words[1] if len(words) == 2 else ''
 		if not scanner.is_url(content):
 			logger.warning('Control message did not contain a URL')
 			await message.channel.send('Invalid URL')
 			return
-		await self.schedule_event(await MovieInfo.from_url(content, fetch_image=True))
+		await self.schedule_event(await MovieInfo.from_url(self.http_session, content, fetch_image=True))
 
 	async def schedule_event(self, info: MovieInfo):
 		"""
@@ -229,10 +311,11 @@ class Domain:
 		:param img: Raw binary data representing the image. Must be a PNG or JPEG format. Optional.
 		"""
 
-		date = datetime.date.today() + datetime.timedelta(days=14 - (datetime.date.today().weekday() - 2))
+		today = datetime.date.today()
+		date = today + datetime.timedelta(days=14 - (today.weekday() - 2))
 		kwargs = {
-			'name': f'TSAY: {info.title}{(" (" + info.year + ")") if info.year else ""}',
-			'start_time': datetime.datetime.combine(date, datetime.time(22), NY_TZ),
+			'name': f'TSAY: {info}',
+			'start_time': datetime.datetime.combine(date, EVENT_TIME, NY_TZ),
 			'channel': self.event_channel,
 			'privacy_level': PrivacyLevel.guild_only,
 		}
@@ -247,17 +330,14 @@ class Domain:
 		logger.info(f'Created event (ID={event.id})')
 
 		await self.announce_channel.send(
-			f'<@&{self.member_role.id}> You are all cordially invited to [a club meeting]({event.url}) on {event.start_time.strftime('%A, %B %e')} to discuss {info.title}. As always, attendance is optional.'
+			f'<@&{self.member_role.id}> You are all cordially invited to [a club meeting]({event.url}) on {format_day(event.start_time)} to discuss {info.title}. As always, attendance is optional.'
 		)
 
-		events = self.read_sessions() + [Session(event.id, info.title, 2)]
-		self.write_sessions(events)
+		async with self.sessions_lock:
+			await self.save_sessions(self.read_sessions() + [Session(event.id, info.title, 2)])
 
 	async def announce(self):
-		async with asyncio.TaskGroup() as tg:
-			event_task = tg.create_task(self.announce_events())
-			birthday_task = tg.create_task(self.announce_birthdays())
-		announcements = event_task.result() + birthday_task.result()
+		announcements = await self.announce_events() + await self.announce_birthdays()
 		if len(announcements) == 1:
 			await self.announce_channel.send(
 				f'<@&{self.member_role.id}> {announcements[0]}'
@@ -270,33 +350,33 @@ class Domain:
 		logger.info(f'Finished making {len(announcements)} announcements')
 
 	async def announce_events(self) -> list[str]:
-		sessions = self.read_sessions()
-		async with asyncio.TaskGroup() as tg:
-			tasks = [
-				tg.create_task(self.announce_event(event))
-				for event in sessions
-			]
-
-		results = await asyncio.gather(*tasks)
-		self.write_sessions([result[0] for result in results if result[0]])
+		async with self.sessions_lock:
+			sessions = self.read_sessions()
+			now = datetime.datetime.now(NY_TZ)
+			results = [await self.announce_event(session, now) for session in sessions]
+
+			# Most passes leave every session as it was, in which case the file is left alone rather than rewritten.
+			kept = [result[0] for result in results if result[0]]
+			if kept != sessions:
+				await self.save_sessions(kept)
 		logger.info('Reminders completed')
 		return [result[1] for result in results if result[1]]
 
-	async def announce_event(self, session: Session) -> tuple[Session|None,str|None]:
+	async def announce_event(self, session: Session, now: datetime.datetime) -> tuple[Session|None,str|None]:
 
-		event = self.guild.get_scheduled_event(int(session.id))
+		event = self.guild.get_scheduled_event(session.id)
 		if event is None:
 			logger.warning(f'Failed to find scheduled event with id {session.id} ({session.title})')
 			return None, None
 		if event.status is not EventStatus.scheduled:
-			logger.debug(f'Skipping event with ID {session.id} due to its status: {event.status}')
+			logger.debug('Skipping event with ID %s due to its status: %s', session.id, event.status)
 			return None, None
 		if not event.channel or event.channel != self.event_channel:
-			logger.debug(f'Skipping event with ID {session.id} that is not for the voice channel')
+			logger.debug('Skipping event with ID %s that is not for the voice channel', session.id)
 			return None, None
 
 		start_time = event.start_time.astimezone(NY_TZ)
-		time_remaining = start_time - datetime.datetime.now(NY_TZ)
+		time_remaining = start_time - now
 		logger.info(f'Event with ID {session.id} at {start_time.isoformat()} in {time_remaining.days} days')
 
 		if time_remaining.days < 0:
@@ -309,10 +389,10 @@ class Domain:
 
 		elif time_remaining.days <= 2 and session.reminder_count >= 2:
 			logger.info(f'Announcing 2-day reminder for event with ID {session.id} at {start_time.isoformat()}')
-			return session.replace(reminder_count=1), f'We will be meeting on {start_time.strftime('%A')} to discuss {session.title}.'
+			return session.replace(reminder_count=1), f'We will be meeting on {WEEKDAY_NAMES[start_time.weekday()]} to discuss {session.title}.'
 
 		else:
-			logger.debug(f'Skipping event at {start_time.isoformat()}')
+			logger.debug('Skipping event at %s', start_time.isoformat())
 			return session, None
 
 	async def announce_birthdays(self) -> list[str]:
@@ -331,49 +411,58 @@ class Domain:
 
 	def read_sessions(self) -> list[Session]:
 		try:
-			events_file = open(self.events_path)
+			events_file = open(self.events_path, 'rb')
 		except FileNotFoundError:
 			return []
-		events = json.load(events_file)
-		events_file.close()
-		return [
-			Session.fromdict(event)
-			for event in events
-		]
+		with events_file:
+			# The file is only parsed again once it has been replaced or modified since the last read.
+			stat = os.fstat(events_file.fileno())
+			key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+			if self.sessions_cache and self.sessions_cache[0] == key:
+				return list(self.sessions_cache[1])
+			sessions = [Session.fromdict(session) for session in orjson.loads(events_file.read())]
+		self.sessions_cache = (key, sessions)
+		return list(sessions)
 
 	def write_sessions(self, sessions: Iterable[Session]):
-		with open(self.events_path, 'w') as events_file:
-			json.dump([session.todict() for session in sessions if session], events_file)
+		dump_atomic([session.todict() for session in sessions if session], self.events_path)
+
+	async def save_sessions(self, sessions: list[Session]):
+		"""
+		Writes the sessions file from a worker thread so that the event loop is not blocked on disk I/O.
+
+		The caller must hold `sessions_lock` from the `read_sessions()` call that `sessions` was derived from until this
+		returns, otherwise a concurrent update can read the old file and overwrite this one.
+		"""
+
+		await asyncio.to_thread(self.write_sessions, sessions)
 
 	def read_members(self) -> list[ClubMember]:
 		try:
-			members_file = open(self.members_path)
+			members_file = open(self.members_path, 'rb')
 		except FileNotFoundError:
 			return []
-		members = json.load(members_file)
-		members_file.close()
-		return [
-			ClubMember.fromdict(member)
-			for member in members
-		]
+		with members_file:
+			return [ClubMember.fromdict(member) for member in orjson.loads(members_file.read())]
 	
 	def write_members(self, members: Iterable[ClubMember | None]):
-		with open(self.members_path, 'w') as members_file:
-			json.dump([member.todict() for member in members if member], members_file)
+		dump_atomic([member.todict() for member in members if member], self.members_path)
 
 	async def handle_updated_event(self, before: ScheduledEvent, after: ScheduledEvent):
 
-		sessions = self.read_sessions()
-		session = {
-			session.id: session for session in sessions
-		}.get(after.id)
-		if not session:
-			return
-
+		async with self.sessions_lock:
+			sessions = self.read_sessions()
+			index = next((i for i, session in enumerate(sessions) if session.id == after.id), None)
+			if index is None:
+				return
+			session = sessions[index]
+			if session.reminder_count != 2:
+				sessions[index] = session.replace(reminder_count=2)
+				await self.save_sessions(sessions)
+
+		# The announcement is sent after the lock is released so that other updates don't wait on the Discord API.
 		if before.start_time != after.start_time:
-			await self.announce_channel.send(f'<@&{self.member_role.id}> The upcoming session to discuss {session.title} has been rescheduled to {after.start_time.strftime('%A, %B %e')}.')		
-		session.reminder_count = 2
-		self.write_sessions(sessions)
+			await self.announce_channel.send(f'<@&{self.member_role.id}> The upcoming session to discuss {session.title} has been rescheduled to {format_day(after.start_time)}.')
 
 class Bot(Client):
 
@@ -390,11 +479,32 @@ class Bot(Client):
 		self.__data_dir = data_dir
 
 		self.domains: dict[int,Domain] = {}
+		self.control_channels: dict[int,Domain] = {}	# Domains keyed by the ID of their control channel
 
 		self.reminder_timer: Timer | None = None
 
 		self.tree = app_commands.CommandTree(self)
 
+		# Shared by every Letterboxd fetch so that connections are kept alive and reused.
+		self.__http_session: aiohttp.ClientSession | None = None
+
+	@property
+	def http_session(self) -> aiohttp.ClientSession:
+		assert self.__http_session, 'The HTTP session is only available once setup_hook() has run.'
+		return self.__http_session
+
+	async def setup_hook(self):
+		# limit_per_host matches a ballot's four page fetches, so they run in parallel, each on its own connection, and
+		# no host ever gets more than four at once. Idle connections are kept for 60 seconds and DNS answers for five
+		# minutes, which only spares a handshake or lookup for requests made close together.
+		connector = aiohttp.TCPConnector(limit=64, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60)
+		self.__http_session = aiohttp.ClientSession(connector=connector)
+
+	async def close(self):
+		if self.__http_session:
+			await self.__http_session.close()
+		await super().close()
+
 	async def on_ready(self):
 
 		if not self.domains:
@@ -410,7 +520,7 @@ class Bot(Client):
 
 		if self.reminder_timer.delay > 4 * 60 * 60:
 			logger.info('Sending immediate reminders')
-			asyncio.create_task(self.send_reminders())
+			await self.send_reminders()
 		else:
 			logger.info('Skipping immediate reminders')
 
@@ -431,6 +541,10 @@ class Bot(Client):
 			domain.guild.id: domain
 			for domain in domains
 		}
+		self.control_channels = {
+			domain.control_channel.id: domain
+			for domain in domains
+		}
 
 	def load_domain(self, name: str, cfg: dict[str,int]):
 		guild = self.get_guild(cfg['guild'])
@@ -475,7 +589,7 @@ class Bot(Client):
 		if member_role.guild != guild:
 			raise RuntimeError(f'Specified member role is not part of the Guild.')
 
-		return Domain(name, guild, control_channel, vote_channel, announce_channel, event_channel, member_role, self.__data_dir)
+		return Domain(name, guild, control_channel, vote_channel, announce_channel, event_channel, member_role, self.__data_dir, self.http_session)
 
 	def resolve_domain(self, guild: int | Guild | None) -> Domain | None:
 		if not guild:
@@ -486,7 +600,8 @@ class Bot(Client):
 
 	async def on_message(self, message: Message):
 
-		domain = self.resolve_domain(message.guild)
+		# Commands are only accepted in control channels, so every other message is dismissed with one lookup.
+		domain = self.control_channels.get(message.channel.id)
 		if not domain:
 			return
 		if self.user not in message.mentions:
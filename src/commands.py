@@ -1,6 +1,5 @@
 from collections.abc import Callable, Coroutine
 import asyncio
-import datetime
 import random
 
 from discord import app_commands, AppCommandType, Interaction, Message, Poll
@@ -8,8 +7,8 @@ from discord.abc import Messageable
 from discord.ui import Modal, TextInput
 
 from . import scanner
-from .bot import Bot, MovieInfo, logger
-from .emojis import EMOJIS
+from .bot import Bot, MovieInfo, POLL_DURATION, logger
+from .emojis import EMOJI_POOL
 
 class VotingError(Exception):
 	def __init__(self, msg: str, response: str, *args):
@@ -63,22 +62,25 @@ class SlashBallot(Command):
 			await interaction.response.send_message("This is not a valid channel.", ephemeral=True)
 			return
 
+		# Discord only waits 3 seconds for the first response, so the reply is deferred before scraping. That leaves time
+		# to fetch every candidate's backdrop now, and whichever one wins is already cached when voting ends.
+		await interaction.response.defer(thinking=True)
 		async with asyncio.TaskGroup() as tg:
 			tasks = [
-				tg.create_task(MovieInfo.from_url(url))
+				tg.create_task(MovieInfo.from_url(self.client.http_session, url, fetch_image=True))
 				for url in urls
 			]
-		choices = list(zip(random.sample(list(EMOJIS), 4), [task.result() for task in tasks]))
+		choices = tuple(zip(random.sample(EMOJI_POOL, 4), (task.result() for task in tasks)))
 
-		await interaction.response.send_message(
+		await interaction.followup.send(
 f"""
 {interaction.user.display_name} presents, for your consideration, the following films:
 
-{'\n'.join(f"{emoji} [{str(movie)}]({movie.url})" for i, (emoji, movie) in enumerate(choices))}
+{'\n'.join(f"{emoji} [{movie}]({movie.url})" for emoji, movie in choices)}
 """
 		)
 
-		poll = Poll("Which movie do you want to watch for the next session?", duration=datetime.timedelta(hours=24))
+		poll = Poll("Which movie do you want to watch for the next session?", duration=POLL_DURATION)
 		for emoji, movie in choices:
 			poll.add_answer(text=movie.title, emoji=emoji)
 		await interaction.channel.send(content="".join(f"[.]({movie.url})" for _, movie in choices), poll=poll, suppress_embeds=True)
@@ -98,27 +100,28 @@ class BookSession(Command):
 		logger.info(f"Recieved 'End Voting' context menu command. Message: {message.id}; Channel: {message.channel.id}")
 		domain = self.client.resolve_domain(interaction.guild_id)
 		if not domain or interaction.channel_id != domain.vote_channel.id:
-			asyncio.create_task(interaction.response.send_message("This is not a valid channel for this interaction.", ephemeral=True))
+			await interaction.response.send_message("This is not a valid channel for this interaction.", ephemeral=True)
 			return
 		if message.author != self.client.user:
-			asyncio.create_task(interaction.response.send_message("This is not a real ballot.", ephemeral=True))
+			await interaction.response.send_message("This is not a real ballot.", ephemeral=True)
+			return
 		message = await domain.vote_channel.fetch_message(message.id)		# Unfortunately, the message that Discord sends does not include the poll results.
 		try:
 			url, title = self.get_winner(ballot_text=message.content, poll=message.poll)
 		except VotingError as exc:
-			asyncio.create_task(interaction.response.send_message(exc.response, ephemeral=True))
+			await interaction.response.send_message(exc.response, ephemeral=True)
 			logger.warning("Couldn't determine the URL of the vote winner", exc_info=True)
 			return
 		except Exception:
 			logger.exception("Unexpected exception caught while finalizing the vote.", exc_info=True)
-			asyncio.create_task(interaction.response.send_message("An error occurred while finalizing the vote. You'll have to do it manually.", ephemeral=True))
+			await interaction.response.send_message("An error occurred while finalizing the vote. You'll have to do it manually.", ephemeral=True)
 			raise
 		asyncio.create_task(interaction.response.send_message(
 			f"And the winner is... ~~La La Land~~ {title}! I'll proceed to make the club event now.", ephemeral=True
 		))
 		if not message.poll.is_finalized():				# type: ignore # get_winner() has already verified that `poll` is defined.
 			asyncio.create_task(message.poll.end())		# type: ignore # get_winner() has already verified that `poll` is defined.
-		await domain.schedule_event(await MovieInfo.from_url(url, fetch_image=True))
+		await domain.schedule_event(await MovieInfo.from_url(self.client.http_session, url, fetch_image=True))
 
 	def get_winner(self, ballot_text: str, poll: Poll|None) -> tuple[str, str]:
 		"""
@@ -140,11 +143,14 @@ class BookSession(Command):
 			raise VotingError("The target message did not contain a poll.", "This message does not contain a poll.")
 		if len(urls) != len(poll.answers):
 			raise VotingError("The number of markdown-embedded URLs does not match the number of poll answers", "This is not a valid ballot.")
-		highest_vote_count = max([answer.vote_count for answer in poll.answers])
-		winners = [
-			entry for entry in zip(urls, poll.answers)
-			if entry[1].vote_count == highest_vote_count
-		]
+		highest_vote_count = -1
+		winners = []
+		for url, answer in zip(urls, poll.answers):
+			if answer.vote_count > highest_vote_count:
+				highest_vote_count = answer.vote_count
+				winners = [(url, answer)]
+			elif answer.vote_count == highest_vote_count:
+				winners.append((url, answer))
 		if len(winners) > 1:
 			raise VotingError("The target poll had multiple winners", "There is a tie. Please break the tie and try again.")
 		return winners[0][0], winners[0][1].text
@@ -167,3 +167,6 @@ EMOJIS = {
 	"👭🏽", "👩🏽‍🤝‍👩🏿", "👩🏽‍🤝‍👩🏻", "👩🏽‍🤝‍👩🏾", "👩🏽‍🤝‍👩🏼", "👯‍♀️", "🤼‍♀️", "🚺", "🪵", "🥴", "🗺️", "🗺", "🪱", "😟", "🎁", "🔧", "✍️", "✍", "✍🏿", "✍🏻", "✍🏾", "✍🏼", "✍🏽", "🩻", "🧶",
 	"🥱", "🟡", "💛", "🟨", "💴", "☯️", "☯", "🪀", "🤪", "🦓", "🤐", "🧟", "🇦🇽"
 }
+
+# random.sample() needs a sequence, so the set is copied into one once rather than on every ballot.
+EMOJI_POOL = tuple(EMOJIS)
@@ -37,17 +37,22 @@ def main(
 		data_dir,
 	)
 
+	# None of the log formats include thread or process details, so skip collecting them for every record.
+	logging.logThreads = False
+	logging.logProcesses = False
+	logging.logMultiprocessing = False
 	log_handler = logging.FileHandler(logs_dir / 'discord.log')	# Logs exclusively emitted by the discord.py library
 	bot_logger.setLevel(logging.DEBUG)
 	handler = logging.FileHandler(logs_dir / 'bot.log')
-	formatter = logging.Formatter('[{asctime}] [{levelname:<8}] {message} (task: {taskName})', style = '{')
+	formatter = logging.Formatter('[%(asctime)s] [%(levelname)-8s] %(message)s (task: %(taskName)s)')
 	handler.setFormatter(formatter)
 	bot_logger.addHandler(handler)
 
-	if not token_file:
-		token_file = open(paths_cfg.get('token', './token.txt'), 'r')
-	token = token_file.read().strip()
-	token_file.close()
+	if token_file:
+		token = token_file.read().strip()
+		token_file.close()
+	else:
+		token = pathlib.Path(paths_cfg.get('token', './token.txt')).read_text().strip()
 
 	for cmd_type in (BookSession, SlashBallot):
 		bot.tree.add_command(cmd_type(bot).command)
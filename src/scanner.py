@@ -1,14 +1,16 @@
-import regex
+import re
 
-URL_PATTERN = regex.compile(r'^https://(boxd\.it|letterboxd\.com)[^\s]*$')
-BALLOT_URL_PATTERN = regex.compile(r'\[\.\]\((https://[^\)]*)\)')
+URL_PREFIXES = ('https://boxd.it', 'https://letterboxd.com')
+BALLOT_URL_PATTERN = re.compile(r'\[\.\]\((https://[^\)]*)\)')
 
 def is_url(s: str) -> bool:
 	"""
 	Detects if the provided string is a URL or not.
 	"""
 
-	return bool(URL_PATTERN.match(s))
+	# A Letterboxd host prefix followed by no whitespace at all. Since the prefix can't start with whitespace,
+	# splitting yields the string unchanged exactly when it contains none.
+	return s.startswith(URL_PREFIXES) and s.split(maxsplit=1) == [s]
 
 def extract_urls_from_ballot(ballot: str) -> list[str]:
 	"""